@@ -1,137 +1,294 @@
 import sys
 import os
 import collections
+import functools
 import logging
 from pathlib import Path
+from string import Template
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QTabWidget,
-    QLabel, QListWidget, QTextEdit, QPushButton, QSplitter, QTreeView,
-    QLineEdit, QComboBox, QFileSystemModel, QProgressBar, QListWidgetItem,
-    QStyle, QMessageBox, QSizePolicy, QSpacerItem
+    QLabel, QListView, QCheckBox, QTextEdit, QPushButton, QSplitter, QTreeView,
+    QLineEdit, QComboBox, QFileSystemModel, QStyledItemDelegate, QStyleOptionViewItem,
+    QStyle, QMessageBox, QSizePolicy, QSpacerItem, QAbstractItemView
 )
-from PySide6.QtCore import Qt, QDir, QModelIndex, Slot, QSize, QTimer, QCoreApplication # Removed qApp import
-from PySide6.QtGui import QIcon, QPalette, QColor, QFont
+from PySide6.QtCore import (
+    Qt, QDir, QModelIndex, QAbstractListModel, QStringListModel, QRect, Slot, QSize, QTimer,
+    QThread, QThreadPool, QCoreApplication # Removed qApp import
+)
+from PySide6.QtGui import QIcon, QPalette, QColor, QFont, QFontMetrics, QPainter
 
 # Local imports
-from .constants import APP_NAME, CONFIG_DIR, DATA_DIR, DARK_STYLESHEET
+from .constants import (
+    APP_NAME, PALETTE, PROGRESS_STATE_COLORS, get_config_dir, get_data_dir,
+    get_critical_stylesheet, get_dark_stylesheet
+)
 from .utils import sanitize_filename, validate_schema_paths
 from .schema_manager import SchemaManager
-from .worker import BackupWorker
+from .worker import BackupWorker, SchemaLoadSignals, SchemaLoadTask, SchemaValidationTask
 
 # Configure logging for the main application
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - Main - %(message)s')
 
+_ICON_DIR = Path(__file__).parent / "ui/resources/icons"
 
-# --- Custom List Widget Item ---
-class SchemaListItemWidget(QWidget):
-    """Custom widget for displaying schema info in the QListWidget."""
-    def __init__(self, schema_name, is_valid, parent=None):
-        super().__init__(parent)
-        self.schema_name = schema_name
-        self.is_valid = is_valid
+@functools.lru_cache(maxsize=None)
+def _icon(name):
+    """Returns a shared QIcon for an SVG in the icons directory, parsing it only once."""
+    return QIcon(str(_ICON_DIR / name))
 
-        layout = QHBoxLayout(self)
-        layout.setContentsMargins(5, 2, 5, 2) # Original tighter margins
-        layout.setSpacing(5)
 
-        # Validity Indicator (Red 'X' if invalid)
-        self.validity_label = QLabel("❌" if not is_valid else "")
-        self.validity_label.setObjectName("InvalidPathIndicator") # For styling
-        self.validity_label.setFixedWidth(20) # Original width for alignment
-        layout.addWidget(self.validity_label)
+# --- Schema List Model ---
+# Custom item data roles exposed by SchemaListModel
+SchemaNameRole = Qt.ItemDataRole.UserRole
+SchemaValidRole = Qt.ItemDataRole.UserRole + 1
+ProgressRole = Qt.ItemDataRole.UserRole + 2   # int percentage, or None while the bar is hidden
+ProgressTextRole = Qt.ItemDataRole.UserRole + 3
+ProgressStateRole = Qt.ItemDataRole.UserRole + 4 # "", or a PROGRESS_STATE_COLORS key
 
-        # Schema Name
-        self.name_label = QLabel(schema_name)
-        self.name_label.setMinimumWidth(150) # Smaller minimum width
-        self.name_label.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Preferred)
-        self.name_label.setWordWrap(False) # Don't wrap text
-        layout.addWidget(self.name_label) # No stretch factor - use only needed width
-
-        # Progress Bar (initially hidden or minimal)
-        self.progress_bar = QProgressBar()
-        self.progress_bar.setMinimum(0)
-        self.progress_bar.setMaximum(100)
-        self.progress_bar.setValue(0)
-        self.progress_bar.setTextVisible(False) # Show percentage later if needed
-        self.progress_bar.setFixedHeight(15) # Original height
-        # Allow progress bar to expand to fill all available space
-        self.progress_bar.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
-        self.progress_bar.setVisible(False) # Initially hidden
-        layout.addWidget(self.progress_bar, 1) # Stretch factor of 1 - takes all remaining space
-
-    def set_progress(self, value):
-        self.progress_bar.setValue(value)
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setTextVisible(True)
-        self.progress_bar.setFormat(f"{value}%")
-        # Reset state property initially
-        self.progress_bar.setProperty("state", "")
-        self.progress_bar.setStyle(self.progress_bar.style()) # Force style refresh
-
-    def set_status(self, status):
+
+class SchemaListModel(QAbstractListModel):
+    """List model holding the name, validity and progress state of each schema."""
+    # Progress bar labels for the final job states
+    _STATE_LABELS = {"success": "Success", "failed": "Failed", "cancelled": "Cancelled", "warning": "Warning"}
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows = [] # One dict per schema, in display order
+        self._row_by_name = {} # Maps schema_name to its row number
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row = self._rows[index.row()]
+        if role in (Qt.ItemDataRole.DisplayRole, SchemaNameRole):
+            return row['name']
+        if role == SchemaValidRole:
+            return row['is_valid']
+        if role == ProgressRole:
+            return row['progress']
+        if role == ProgressTextRole:
+            return row['progress_text']
+        if role == ProgressStateRole:
+            return row['state']
+        return None
+
+    def set_schemas(self, schemas):
+        """Replaces all rows from an iterable of (schema_name, is_valid) pairs."""
+        self.beginResetModel()
+        self._rows = [
+            {'name': name, 'is_valid': is_valid, 'progress': None, 'progress_text': "", 'state': ""}
+            for name, is_valid in schemas
+        ]
+        self._row_by_name = {row['name']: i for i, row in enumerate(self._rows)}
+        self.endResetModel()
+
+    def insert_schema(self, row, schema_name, is_valid):
+        """Inserts a single schema row at the given position."""
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._rows.insert(row, {'name': schema_name, 'is_valid': is_valid, 'progress': None, 'progress_text': "", 'state': ""})
+        self._row_by_name = {row_data['name']: i for i, row_data in enumerate(self._rows)}
+        self.endInsertRows()
+
+    def remove_schema(self, schema_name):
+        """Removes a single schema row, if present."""
+        row = self._row_by_name.get(schema_name)
+        if row is None:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._row_by_name = {row_data['name']: i for i, row_data in enumerate(self._rows)}
+        self.endRemoveRows()
+
+    def index_for(self, schema_name):
+        """Returns the model index for a schema name (invalid if unknown)."""
+        row = self._row_by_name.get(schema_name)
+        if row is None:
+            return QModelIndex()
+        return self.index(row)
+
+    def _update_row(self, schema_name, **values):
+        """Updates one row's fields and notifies views for that row only, if anything changed."""
+        row = self._row_by_name.get(schema_name)
+        if row is None:
+            return
+        row_data = self._rows[row]
+        if all(row_data[key] == value for key, value in values.items()):
+            return # e.g. rsync repeating the same percentage; skip the repaint
+        row_data.update(values)
+        index = self.index(row)
+        self.dataChanged.emit(index, index)
+
+    def set_progress(self, schema_name, value):
+        self._update_row(schema_name, progress=value, progress_text=f"{value}%", state="")
+
+    def set_status(self, schema_name, status):
         """Sets the final state of the progress bar (success, failed, cancelled, warning)."""
-        self.progress_bar.setValue(100) # Always fill bar on completion
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setTextVisible(True)
-        
+        state = status.casefold()
         # Check if the status message is a warning (partial success)
-        if status.lower().startswith("completed with warnings"):
-            display_text = "Warning"
-            property_state = "warning"
-        else:
-            display_text = status.capitalize()
-            property_state = status.lower()
-            
-        self.progress_bar.setFormat(display_text)
-        self.progress_bar.setProperty("state", property_state) # Set custom property for styling
-        self.progress_bar.setStyle(self.progress_bar.style()) # Force style refresh
+        if state.startswith("completed with warnings"):
+            state = "warning"
+        display_text = self._STATE_LABELS.get(state) or status.capitalize()
+        # Always fill bar on completion
+        self._update_row(schema_name, progress=100, progress_text=display_text, state=state)
 
-    def reset_status(self):
+    def reset_status(self, schema_name):
         """Resets the progress bar to its initial hidden state."""
-        self.progress_bar.setValue(0)
-        self.progress_bar.setVisible(False)
-        self.progress_bar.setTextVisible(False)
-        self.progress_bar.setProperty("state", "")
-        self.progress_bar.setStyle(self.progress_bar.style())
+        self._update_row(schema_name, progress=None, progress_text="", state="")
+
+    def update_validity(self, schema_name, is_valid):
+        self._update_row(schema_name, is_valid=is_valid)
+
+
+class SchemaItemDelegate(QStyledItemDelegate):
+    """
+    Paints schema list rows directly with QPainter: validity indicator,
+    schema name and an inline progress bar. Replaces a per-row QWidget with
+    its own layout, labels and QProgressBar.
+    """
+    MARGIN = 5 # Horizontal row margin and spacing between parts
+    INDICATOR_WIDTH = 20
+    NAME_MIN_WIDTH = 150
+    BAR_HEIGHT = 15
+    ROW_MIN_HEIGHT = 50 # Minimum height for proper text display with larger font
+    EXTRA_WIDTH = 50 # Extra width padding
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._name_fonts = {} # Maps base font key to (name font, its metrics)
+
+    def _name_font(self, base_font):
+        """Returns the schema name font and its metrics, built once per base font."""
+        key = base_font.key()
+        cached = self._name_fonts.get(key)
+        if cached is None:
+            font = QFont(base_font)
+            font.setPointSize(14) # Larger than the 12pt base font
+            font.setWeight(QFont.Weight.Medium) # Slightly bolder for better readability
+            cached = self._name_fonts[key] = (font, QFontMetrics(font))
+        return cached
+
+    def paint(self, painter, option, index):
+        opt = QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = "" # The name is drawn below with its own font
+        style = opt.widget.style() if opt.widget else QApplication.style()
+        # Item background (selection colors come from the stylesheet)
+        style.drawPrimitive(QStyle.PrimitiveElement.PE_PanelItemViewItem, opt, painter, opt.widget)
+
+        painter.save()
+        rect = option.rect.adjusted(self.MARGIN, 2, -self.MARGIN, -2)
+        x = rect.left()
 
-    def update_validity(self, is_valid):
-        self.is_valid = is_valid
-        self.validity_label.setText("❌" if not is_valid else "")
+        # Validity Indicator (Red 'X' if invalid)
+        if not index.data(SchemaValidRole):
+            painter.setPen(QColor(PALETTE["error"]))
+            painter.drawText(QRect(x, rect.top(), self.INDICATOR_WIDTH, rect.height()),
+                             Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, "❌")
+        x += self.INDICATOR_WIDTH + self.MARGIN
+
+        # Schema Name
+        name = index.data(SchemaNameRole)
+        name_font, name_metrics = self._name_font(option.font)
+        name_width = max(self.NAME_MIN_WIDTH, name_metrics.horizontalAdvance(name))
+        selected = bool(option.state & QStyle.StateFlag.State_Selected)
+        text_role = QPalette.ColorRole.HighlightedText if selected else QPalette.ColorRole.Text
+        painter.setFont(name_font)
+        painter.setPen(opt.palette.color(text_role))
+        painter.drawText(QRect(x, rect.top(), name_width, rect.height()),
+                         Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, name)
+        x += name_width + self.MARGIN
+
+        # Progress Bar (hidden until a backup has started for this schema)
+        progress = index.data(ProgressRole)
+        if progress is not None and rect.right() > x:
+            bar = QRect(x, rect.center().y() - self.BAR_HEIGHT // 2, rect.right() - x, self.BAR_HEIGHT)
+            painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+            painter.setPen(QColor(PALETTE["border"]))
+            painter.setBrush(QColor(PALETTE["panel"]))
+            painter.drawRoundedRect(bar, 5, 5)
+
+            chunk = bar.adjusted(2, 2, -2, -2)
+            chunk.setWidth(chunk.width() * progress // 100)
+            if chunk.width() > 0:
+                state = index.data(ProgressStateRole)
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(QColor(PROGRESS_STATE_COLORS.get(state, PALETTE["accent"])))
+                painter.drawRoundedRect(chunk, 4, 4)
+
+            painter.setFont(option.font)
+            painter.setPen(QColor(PALETTE["text"]))
+            painter.drawText(bar, Qt.AlignmentFlag.AlignCenter, index.data(ProgressTextRole))
+        painter.restore()
+
+    def sizeHint(self, option, index):
+        # Every row has the same height, so only the name width needs measuring;
+        # no layout pass is involved.
+        _, name_metrics = self._name_font(option.font)
+        name_width = max(self.NAME_MIN_WIDTH, name_metrics.horizontalAdvance(index.data(SchemaNameRole)))
+        width = self.MARGIN * 4 + self.INDICATOR_WIDTH + name_width + self.EXTRA_WIDTH
+        return QSize(width, self.ROW_MIN_HEIGHT)
 
 
 # --- Main Application Window ---
 class MainWindow(QMainWindow):
+    # Status bar styles, built once; Qt re-parses and re-polishes on every setStyleSheet()
+    # Colors come from PALETTE, like the theme's .qss files
+    _STATUS_STYLE_TEMPLATE = Template("QLabel#StatusBar { color: ${color}; background-color: ${status_bg}; border-top: 1px solid ${subtle}; font-weight: bold; padding: 3px; }")
+    _STATUS_STYLE_OK = _STATUS_STYLE_TEMPLATE.substitute(PALETTE, color=PALETTE["text"])
+    _STATUS_STYLE_ERR = _STATUS_STYLE_TEMPLATE.substitute(PALETTE, color=PALETTE["error"])
+
     def __init__(self):
         super().__init__()
         self.setWindowTitle(APP_NAME)
         self.setGeometry(100, 100, 1200, 750) # Increased window size from 950x650 to 1200x750
 
         # Ensure Config and Data directories exist
-        CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        get_config_dir().mkdir(parents=True, exist_ok=True)
+        get_data_dir().mkdir(parents=True, exist_ok=True)
 
         self.schema_manager = SchemaManager()
         self.schemas = {} # Holds loaded schema data {schema_name: data}
+        self._schema_load_id = 0 # Incremented per load; stale background results are dropped
+        self._refreshed_since_load = set() # Schemas re-read after the current load; its validation results for them are stale
+        self._schema_load_signals = SchemaLoadSignals(self)
         self.backup_queue = collections.deque()
+        self.backup_queue_set = set() # Mirrors backup_queue for O(1) membership checks
         self.current_worker = None
-        self.schema_list_items = {} # Maps schema_name to QListWidgetItem
-        self.schema_custom_widgets = {} # Maps schema_name to SchemaListItemWidget
+        self.worker_thread = None # QThread the current worker runs on
+        self._source_paths_set = set() # Paths in the sources model, for O(1) duplicate checks
+        self._loading_edit_fields = False # True while fields are filled programmatically
+        self._status_is_error = None # Style currently applied to the status bar (None: not yet set)
+
+        # Progress signals from the worker are coalesced and applied at most every 50ms
+        self._pending_progress = {} # Maps schema_name to its latest percentage
+        self.progress_flush_timer = QTimer(self)
+        self.progress_flush_timer.setSingleShot(True)
+        self.progress_flush_timer.setInterval(50)
+        self.progress_flush_timer.timeout.connect(self.flush_pending_progress)
+
+        # Log lines are buffered and appended to the activity log in batches every 100ms
+        self._log_buffer = []
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(100)
+        self.log_flush_timer.timeout.connect(self.flush_log_buffer)
 
         self.setup_ui()
         self.apply_styles()
         self.connect_signals()
 
-        self.load_and_display_schemas()
-
-        # Timer to periodically check queue and start next backup
-        self.queue_timer = QTimer(self)
-        self.queue_timer.timeout.connect(self.process_backup_queue)
-        self.queue_timer.start(1000) # Check every second
+        # Schemas are read on the thread pool so the window can paint right away
+        self.load_schemas_async()
 
     def setup_ui(self):
         """Sets up the main UI layout and widgets."""
         central_widget = QWidget()
+        central_widget.setObjectName("CentralWidget") # For styling
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
         main_layout.setContentsMargins(5, 5, 5, 5) # Add some padding
@@ -170,10 +327,14 @@ class MainWindow(QMainWindow):
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(10, 10, 10, 10)
         left_layout.addWidget(QLabel("Backup Schemas:"))
-        self.schema_list_widget = QListWidget()
-        self.schema_list_widget.setObjectName("SchemaList") # For styling
-        self.schema_list_widget.setMinimumWidth(400) # Increased minimum width from 300 to 400
-        left_layout.addWidget(self.schema_list_widget)
+        self.schema_list_model = SchemaListModel(self)
+        self.schema_list_view = QListView()
+        self.schema_list_view.setObjectName("SchemaList") # For styling
+        self.schema_list_view.setModel(self.schema_list_model)
+        self.schema_list_view.setItemDelegate(SchemaItemDelegate(self.schema_list_view))
+        self.schema_list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.schema_list_view.setMinimumWidth(400) # Increased minimum width from 300 to 400
+        left_layout.addWidget(self.schema_list_view)
         splitter.addWidget(left_panel)
 
         # Right Panel: Activity Log
@@ -183,6 +344,7 @@ class MainWindow(QMainWindow):
         self.activity_log = QTextEdit()
         self.activity_log.setReadOnly(True)
         self.activity_log.setFontFamily("monospace") # Good for logs
+        self.activity_log.document().setMaximumBlockCount(5000) # Bound memory on long runs
         right_layout.addWidget(self.activity_log)
         splitter.addWidget(right_panel)
 
@@ -193,13 +355,13 @@ class MainWindow(QMainWindow):
         button_layout.addStretch()
 
         self.queue_button = QPushButton("Queue Backup")
-        self.queue_button.setIcon(QIcon(str(Path(__file__).parent / "ui/resources/icons/queue.svg")))
+        self.queue_button.setIcon(_icon("queue.svg"))
         self.queue_button.setIconSize(QSize(24, 24))
         self.queue_button.setEnabled(False) # Initially disabled
         button_layout.addWidget(self.queue_button)
 
         self.cancel_button = QPushButton("Cancel Running")
-        self.cancel_button.setIcon(QIcon(str(Path(__file__).parent / "ui/resources/icons/cancel.svg")))
+        self.cancel_button.setIcon(_icon("cancel.svg"))
         self.cancel_button.setIconSize(QSize(24, 24))
         self.cancel_button.setEnabled(False) # Initially disabled
         button_layout.addWidget(self.cancel_button)
@@ -219,19 +381,19 @@ class MainWindow(QMainWindow):
         top_bar_layout.addWidget(self.schema_selector_combo)
 
         self.new_schema_button = QPushButton("New")
-        self.new_schema_button.setIcon(QIcon(str(Path(__file__).parent / "ui/resources/icons/add.svg")))
+        self.new_schema_button.setIcon(_icon("add.svg"))
         self.new_schema_button.setIconSize(QSize(24, 24))
         top_bar_layout.addWidget(self.new_schema_button)
 
         self.save_schema_button = QPushButton("Save")
         # Using add.svg as a fallback since save.svg isn't available
-        self.save_schema_button.setIcon(QIcon(str(Path(__file__).parent / "ui/resources/icons/add.svg")))
+        self.save_schema_button.setIcon(_icon("add.svg"))
         self.save_schema_button.setIconSize(QSize(24, 24))
         self.save_schema_button.setEnabled(False) # Enable when changes are made
         top_bar_layout.addWidget(self.save_schema_button)
 
         self.delete_schema_button = QPushButton("Delete")
-        self.delete_schema_button.setIcon(QIcon(str(Path(__file__).parent / "ui/resources/icons/delete.svg")))
+        self.delete_schema_button.setIcon(_icon("delete.svg"))
         self.delete_schema_button.setIconSize(QSize(24, 24))
         self.delete_schema_button.setEnabled(False) # Enable when schema selected
         top_bar_layout.addWidget(self.delete_schema_button)
@@ -246,10 +408,21 @@ class MainWindow(QMainWindow):
         left_panel = QWidget()
         left_layout = QVBoxLayout(left_panel)
         left_layout.setContentsMargins(10, 10, 10, 10)
-        left_layout.addWidget(QLabel("Select Paths:"))
+        paths_header_layout = QHBoxLayout()
+        paths_header_layout.addWidget(QLabel("Select Paths:"))
+        paths_header_layout.addStretch()
+        self.show_files_checkbox = QCheckBox("Show files") # Sources and destinations are mostly directories
+        paths_header_layout.addWidget(self.show_files_checkbox)
+        self.show_hidden_checkbox = QCheckBox("Show hidden") # Dotfiles are only enumerated when asked for
+        paths_header_layout.addWidget(self.show_hidden_checkbox)
+        left_layout.addLayout(paths_header_layout)
         self.fs_model = QFileSystemModel()
-        self.fs_model.setRootPath(QDir.rootPath()) # Start at root
-        self.fs_model.setFilter(QDir.Filter.AllDirs | QDir.Filter.Files | QDir.Filter.NoDotAndDotDot | QDir.Filter.Hidden) # Show all dirs, files and hidden items
+        # The tree only needs names: skip per-directory file watchers and custom folder icon lookups
+        self.fs_model.setOption(QFileSystemModel.Option.DontWatchForChanges, True)
+        self.fs_model.setOption(QFileSystemModel.Option.DontUseCustomDirectoryIcons, True)
+        # Only the top level is read up front; directories are enumerated as they are expanded
+        self.fs_model.setRootPath("")
+        self.update_fs_filter()
 
         self.tree_view = QTreeView()
         self.tree_view.setModel(self.fs_model)
@@ -283,9 +456,13 @@ class MainWindow(QMainWindow):
 
         # Source Paths
         right_layout.addWidget(QLabel("Source Paths:"))
-        self.source_paths_list = QListWidget()
-        self.source_paths_list.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection) # Allow multi-select for removal
-        right_layout.addWidget(self.source_paths_list)
+        self._sources_model = QStringListModel([])
+        self.source_paths_view = QListView()
+        self.source_paths_view.setObjectName("SourcePaths") # For styling
+        self.source_paths_view.setModel(self._sources_model)
+        self.source_paths_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        self.source_paths_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection) # Allow multi-select for removal
+        right_layout.addWidget(self.source_paths_view)
 
         source_button_layout = QHBoxLayout()
         self.add_source_button = QPushButton("Add Selected to Sources")
@@ -312,14 +489,19 @@ class MainWindow(QMainWindow):
 
     def apply_styles(self):
         """Applies the dark stylesheet."""
-        self.setStyleSheet(DARK_STYLESHEET)
+        # Only the critical rules are parsed before the first paint; the full
+        # sheet follows as soon as the event loop starts.
+        self.setStyleSheet(get_critical_stylesheet())
+        QTimer.singleShot(0, lambda: self.setStyleSheet(get_dark_stylesheet()))
         # Optional: Force fusion style for more consistency if needed
         # QApplication.setStyle(QStyleFactory.create('Fusion'))
 
     def connect_signals(self):
         """Connects UI signals to their slots."""
         # Run Tab
-        self.schema_list_widget.itemSelectionChanged.connect(self.update_run_button_state)
+        self.schema_list_view.selectionModel().selectionChanged.connect(self.update_run_button_state)
+        self._schema_load_signals.schemasLoaded.connect(self.on_schemas_loaded)
+        self._schema_load_signals.schemaValidated.connect(self.on_schema_validated)
         self.queue_button.clicked.connect(self.queue_selected_backup)
         self.cancel_button.clicked.connect(self.cancel_current_backup)
 
@@ -332,52 +514,61 @@ class MainWindow(QMainWindow):
         self.add_source_button.clicked.connect(self.add_selected_path_to_sources)
         self.remove_source_button.clicked.connect(self.remove_selected_sources)
         self.set_destination_button.clicked.connect(self.set_selected_path_as_destination)
+        self.show_files_checkbox.toggled.connect(self.update_fs_filter)
+        self.show_hidden_checkbox.toggled.connect(self.update_fs_filter)
 
         # Enable save button when fields change
-        self.schema_name_edit.textChanged.connect(lambda: self.save_schema_button.setEnabled(True))
-        self.source_paths_list.model().rowsInserted.connect(lambda: self.save_schema_button.setEnabled(True))
-        self.source_paths_list.model().rowsRemoved.connect(lambda: self.save_schema_button.setEnabled(True))
-        self.destination_path_edit.textChanged.connect(lambda: self.save_schema_button.setEnabled(True))
+        self.schema_name_edit.textChanged.connect(self._mark_dirty)
+        self._sources_model.rowsInserted.connect(self._mark_dirty)
+        self._sources_model.rowsRemoved.connect(self._mark_dirty)
+        self.destination_path_edit.textChanged.connect(self._mark_dirty)
 
 
     # --- Schema Loading and Display ---
+    def load_schemas_async(self):
+        """Starts loading schemas on the global thread pool; the UI lists are filled when they arrive."""
+        logging.info("Loading schemas in the background...")
+        self._schema_load_id += 1
+        self.update_status_bar("Loading schemas...")
+        task = SchemaLoadTask(self.schema_manager, self._schema_load_signals, self._schema_load_id)
+        QThreadPool.globalInstance().start(task)
+
+    @Slot(int, object)
+    def on_schemas_loaded(self, load_id, schemas):
+        """Receives schemas from a background load."""
+        if load_id != self._schema_load_id:
+            return # A newer load (e.g. after a save) has superseded this one
+        self.display_schemas(schemas)
+
     @Slot()
     def load_and_display_schemas(self):
         """Loads schemas from disk and updates both UI lists."""
         logging.info("Reloading schemas...")
-        self.schemas = self.schema_manager.load_schemas()
+        self._schema_load_id += 1 # Supersedes any background load still in flight
+        # Path checks stat every source/destination, so they run in the background
+        self.display_schemas(self.schema_manager.load_schemas(validate=False))
+
+    def display_schemas(self, schemas):
+        """Updates both UI lists from loaded schema data."""
+        self.schemas = schemas
         sorted_schema_names = sorted(self.schemas.keys())
 
         # --- Update Run Tab List ---
-        self.schema_list_widget.clear()
-        self.schema_list_items.clear()
-        self.schema_custom_widgets.clear() # Clear old custom widgets
-        for name in sorted_schema_names:
-            schema_data = self.schemas[name]
-            is_valid = schema_data.get('_is_valid', True) # Default to valid if key missing
-
-            item = QListWidgetItem(self.schema_list_widget)
-            widget = SchemaListItemWidget(name, is_valid)
-
-            # Store references
-            self.schema_list_items[name] = item
-            self.schema_custom_widgets[name] = widget
-
-            # Force a minimum height for proper text display with larger font
-            size_hint = widget.sizeHint()
-            size_hint.setHeight(max(50, size_hint.height())) # Ensure minimum height of 50px
-            size_hint.setWidth(size_hint.width() + 50) # Add 50px extra width padding
-            
-            item.setSizeHint(size_hint) # Set the adjusted size hint
-            self.schema_list_widget.addItem(item)
-            self.schema_list_widget.setItemWidget(item, widget)
+        # A single model reset, so the view relayouts and repaints once
+        self.schema_list_model.set_schemas(
+            # Default to valid if key missing
+            (name, self.schemas[name].get('_is_valid', True)) for name in sorted_schema_names
+        )
 
         # --- Update Edit Tab ComboBox ---
         self.schema_selector_combo.blockSignals(True) # Prevent triggering load while populating
-        self.schema_selector_combo.clear()
-        self.schema_selector_combo.addItem("") # Add blank option
-        self.schema_selector_combo.addItems(sorted_schema_names)
-        self.schema_selector_combo.blockSignals(False)
+        self.schema_selector_combo.setUpdatesEnabled(False)
+        try:
+            self.schema_selector_combo.clear()
+            self.schema_selector_combo.addItems([""] + sorted_schema_names) # Blank option first, in one insert
+        finally:
+            self.schema_selector_combo.setUpdatesEnabled(True)
+            self.schema_selector_combo.blockSignals(False)
 
         self.clear_edit_fields() # Clear fields after reloading
         self.update_run_button_state()
@@ -385,19 +576,93 @@ class MainWindow(QMainWindow):
         logging.info(f"Loaded {len(self.schemas)} schemas.")
         self.update_status_bar(f"Loaded {len(self.schemas)} schemas.")
 
+        # Rows show as valid until their paths have been checked; the worker
+        # re-validates before every run regardless.
+        self._refreshed_since_load.clear()
+        task = SchemaValidationTask(self.schemas, self._schema_load_signals, self._schema_load_id)
+        QThreadPool.globalInstance().start(task)
+
+    def refresh_single_schema(self, schema_name):
+        """
+        Re-reads one schema from disk and updates just its entries in both UI
+        lists, instead of reloading the whole config directory.
+        """
+        schema_data = self.schema_manager.load_single_schema(schema_name)
+        if schema_data is None:
+            self.load_and_display_schemas() # Fall back to a full reload
+            return
+
+        # A different schema name may have sanitized to the same file (overwrite)
+        replaced_names = [
+            name for name, data in self.schemas.items()
+            if name != schema_name and data.get('_filepath') == schema_data['_filepath']
+        ]
+        is_new = schema_name not in self.schemas
+        self.schemas[schema_name] = schema_data
+        # load_single_schema validated the saved paths; drop any in-flight result for the old ones
+        self._refreshed_since_load.add(schema_name)
+        for name in replaced_names:
+            del self.schemas[name]
+
+        self.schema_selector_combo.blockSignals(True) # Prevent triggering load while editing the list
+        try:
+            for name in replaced_names:
+                self.schema_list_model.remove_schema(name)
+                self.schema_selector_combo.removeItem(self.schema_selector_combo.findText(name))
+            if is_new:
+                row = sorted(self.schemas.keys()).index(schema_name)
+                self.schema_list_model.insert_schema(row, schema_name, schema_data['_is_valid'])
+                self.schema_selector_combo.insertItem(row + 1, schema_name) # After the blank option
+            else:
+                self.schema_list_model.update_validity(schema_name, schema_data['_is_valid'])
+        finally:
+            self.schema_selector_combo.blockSignals(False)
+
+        self.update_run_button_state()
+        self.update_edit_delete_button_state()
+
+    def remove_single_schema(self, schema_name):
+        """Drops one deleted schema from both UI lists without reloading the config directory."""
+        self.schemas.pop(schema_name, None)
+        self.schema_list_model.remove_schema(schema_name)
+        self.schema_selector_combo.blockSignals(True) # Prevent triggering load while editing the list
+        try:
+            index = self.schema_selector_combo.findText(schema_name)
+            if index > 0: # Never the blank option
+                self.schema_selector_combo.removeItem(index)
+            self.schema_selector_combo.setCurrentIndex(0)
+        finally:
+            self.schema_selector_combo.blockSignals(False)
+
+        self.clear_edit_fields()
+        self.update_run_button_state()
+        self.update_edit_delete_button_state()
+
+    @Slot(int, str, bool, object)
+    def on_schema_validated(self, load_id, schema_name, is_valid, invalid_paths):
+        """Applies a background path validation result to one schema."""
+        if load_id != self._schema_load_id or schema_name not in self.schemas:
+            return # Result belongs to a superseded load
+        if schema_name in self._refreshed_since_load:
+            return # Checked the paths from before a save; refresh_single_schema already re-validated
+        schema_data = self.schemas[schema_name]
+        schema_data['_is_valid'] = is_valid
+        schema_data['_invalid_paths'] = invalid_paths
+        self.schema_list_model.update_validity(schema_name, is_valid)
+        self.update_run_button_state()
+
 
     @Slot()
     def update_run_button_state(self):
         """Enables/disables Run tab buttons based on selection and state."""
-        selected_items = self.schema_list_widget.selectedItems()
-        is_schema_selected = bool(selected_items)
-        is_worker_running = self.current_worker is not None and self.current_worker.isRunning()
+        selected_indexes = self.schema_list_view.selectionModel().selectedIndexes()
+        is_schema_selected = bool(selected_indexes)
+        is_worker_running = self._is_backup_running()
 
         can_queue = False
         if is_schema_selected:
             # Check if the selected schema is valid
-            item_widget = self.schema_list_widget.itemWidget(selected_items[0])
-            if item_widget and item_widget.is_valid:
+            if selected_indexes[0].data(SchemaValidRole):
                 can_queue = True
 
         self.queue_button.setEnabled(can_queue)
@@ -407,30 +672,45 @@ class MainWindow(QMainWindow):
     @Slot()
     def queue_selected_backup(self):
         """Adds the selected valid schema to the backup queue."""
-        selected_items = self.schema_list_widget.selectedItems()
-        if not selected_items:
+        selected_indexes = self.schema_list_view.selectionModel().selectedIndexes()
+        if not selected_indexes:
             return
 
-        item_widget = self.schema_list_widget.itemWidget(selected_items[0])
-        schema_name = item_widget.schema_name
+        index = selected_indexes[0]
+        schema_name = index.data(SchemaNameRole)
 
-        if not item_widget.is_valid:
+        if not index.data(SchemaValidRole):
             self.update_status_bar(f"Cannot queue '{schema_name}': Contains invalid paths.", error=True)
             return
 
-        if schema_name not in self.backup_queue:
-            self.backup_queue.append(schema_name)
+        if self._enqueue(schema_name):
             self.update_status_bar(f"'{schema_name}' added to queue. Queue size: {len(self.backup_queue)}")
-            logging.info(f"Added '{schema_name}' to queue. Queue: {list(self.backup_queue)}")
+            if logging.getLogger().isEnabledFor(logging.INFO): # Avoid copying the queue when not logged
+                logging.info(f"Added '{schema_name}' to queue. Queue: {list(self.backup_queue)}")
+            self.process_backup_queue() # Starts it right away if nothing is running
         else:
             self.update_status_bar(f"'{schema_name}' is already in the queue.")
 
+    def _enqueue(self, schema_name):
+        """Appends a schema to the backup queue. Returns False if it is already queued."""
+        if schema_name in self.backup_queue_set:
+            return False
+        self.backup_queue.append(schema_name)
+        self.backup_queue_set.add(schema_name)
+        return True
+
+    def _dequeue(self):
+        """Pops the next schema name off the backup queue."""
+        schema_name = self.backup_queue.popleft()
+        self.backup_queue_set.discard(schema_name)
+        return schema_name
+
     @Slot()
     def process_backup_queue(self):
         """Checks the queue and starts the next backup if idle."""
-        if self.current_worker is None or not self.current_worker.isRunning():
+        if not self._is_backup_running():
             if self.backup_queue:
-                schema_name = self.backup_queue.popleft()
+                schema_name = self._dequeue()
                 logging.info(f"Dequeuing '{schema_name}'. Queue remaining: {len(self.backup_queue)}")
                 if schema_name in self.schemas:
                     schema_data = self.schemas[schema_name]
@@ -439,30 +719,45 @@ class MainWindow(QMainWindow):
                     logging.warning(f"Schema '{schema_name}' not found in loaded schemas. Skipping.")
                     self.update_status_bar(f"Error: Schema '{schema_name}' not found. Skipping.", error=True)
                     # Try processing next item immediately
-                    QTimer.singleShot(10, self.process_backup_queue) # Use singleShot to avoid recursion depth issues
+                    QTimer.singleShot(0, self.process_backup_queue) # Use singleShot to avoid recursion depth issues
+
+    def _is_backup_running(self):
+        """Returns True while a backup worker's thread is running."""
+        return self.worker_thread is not None and self.worker_thread.isRunning()
 
     def start_backup(self, schema_data):
-        """Starts the BackupWorker thread for the given schema."""
+        """Starts a BackupWorker on its own thread for the given schema."""
         schema_name = schema_data['schema_name']
         logging.info(f"Attempting to start backup for: {schema_name}")
 
         # Reset progress bar for this schema
-        if schema_name in self.schema_custom_widgets:
-            self.schema_custom_widgets[schema_name].reset_status()
-            self.schema_custom_widgets[schema_name].set_progress(0) # Show 0%
+        self.schema_list_model.reset_status(schema_name)
+        self.schema_list_model.set_progress(schema_name, 0) # Show 0%
 
-        self.current_worker = BackupWorker(schema_data)
+        # Each job gets its own worker and thread; the connections below are
+        # bound to this pair, never to whatever self.current_worker is later
+        worker = BackupWorker(schema_data)
+        thread = QThread(self)
+        worker.moveToThread(thread)
 
         # Connect worker signals
-        self.current_worker.progressUpdated.connect(self.update_progress)
-        self.current_worker.logMessage.connect(self.append_log_message)
-        self.current_worker.jobFinished.connect(self.handle_job_finished)
-        self.current_worker.diskSpaceError.connect(self.handle_worker_error)
-        self.current_worker.validationError.connect(self.handle_worker_error)
-        self.current_worker.finished.connect(self.worker_thread_finished) # For cleanup
-
-        self.current_worker.start()
+        worker.progressUpdated.connect(self.update_progress)
+        worker.logMessage.connect(self.append_log_message)
+        worker.jobFinished.connect(self.handle_job_finished)
+        worker.diskSpaceError.connect(self.handle_worker_error)
+        worker.validationError.connect(self.handle_worker_error)
+        # Thread lifecycle: run the job, stop the thread's event loop once it's done,
+        # and delete the worker on its own thread before that thread ends
+        thread.started.connect(worker.start)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(worker.deleteLater)
+        thread.finished.connect(self.worker_thread_finished) # For cleanup; the thread is the sender
+
+        self.current_worker = worker
+        self.worker_thread = thread
+        thread.start()
         self.update_status_bar(f"Running backup for '{schema_name}'...")
+        self._log_buffer.clear() # Drop lines from the previous job that were not flushed yet
         self.activity_log.clear() # Clear log for new job
         self.append_log_message(schema_name, f"--- Starting Backup: {schema_name} ---")
         self.update_run_button_state() # Disable queue, enable cancel
@@ -470,7 +765,7 @@ class MainWindow(QMainWindow):
     @Slot()
     def cancel_current_backup(self):
         """Requests cancellation of the currently running backup."""
-        if self.current_worker and self.current_worker.isRunning():
+        if self._is_backup_running():
             logging.info(f"User requested cancellation for schema: {self.current_worker.schema_name}")
             self.update_status_bar(f"Attempting to cancel backup for '{self.current_worker.schema_name}'...")
             self.current_worker.cancel()
@@ -481,16 +776,33 @@ class MainWindow(QMainWindow):
 
     @Slot(str, int)
     def update_progress(self, schema_name, percentage):
-        """Updates the progress bar for the specific schema."""
-        if schema_name in self.schema_custom_widgets:
-            self.schema_custom_widgets[schema_name].set_progress(percentage)
+        """Records the latest progress for a schema; the bar is updated on the next flush."""
+        self._pending_progress[schema_name] = percentage
+        if not self.progress_flush_timer.isActive():
+            self.progress_flush_timer.start()
+
+    @Slot()
+    def flush_pending_progress(self):
+        """Applies the coalesced progress updates to the schema list."""
+        for schema_name, percentage in self._pending_progress.items():
+            self.schema_list_model.set_progress(schema_name, percentage)
+        self._pending_progress.clear()
 
     @Slot(str, str)
     def append_log_message(self, schema_name, message):
         """Appends a message to the activity log."""
         # Only append if the message is from the currently running job
         if self.current_worker and self.current_worker.schema_name == schema_name:
-            self.activity_log.append(message)
+            self._log_buffer.append(message)
+            if not self.log_flush_timer.isActive():
+                self.log_flush_timer.start()
+
+    @Slot()
+    def flush_log_buffer(self):
+        """Appends all buffered log lines to the activity log in one document update."""
+        if self._log_buffer:
+            self.activity_log.append("\n".join(self._log_buffer))
+            self._log_buffer.clear()
 
     @Slot(str, bool, str)
     def handle_job_finished(self, schema_name, success, status_message):
@@ -509,8 +821,8 @@ class MainWindow(QMainWindow):
             self.update_status_bar(f"Backup for '{schema_name}' failed: {status_message}", error=True)
 
         # Update the persistent progress bar state
-        if schema_name in self.schema_custom_widgets:
-            self.schema_custom_widgets[schema_name].set_status(status)
+        self._pending_progress.pop(schema_name, None) # A late progress flush must not overwrite the final state
+        self.schema_list_model.set_status(schema_name, status)
 
         self.append_log_message(schema_name, f"--- Finished: {schema_name} ({status_message}) ---")
 
@@ -525,25 +837,24 @@ class MainWindow(QMainWindow):
 
     @Slot()
     def worker_thread_finished(self):
-        """Called when the worker thread actually finishes execution."""
+        """Called when a worker thread actually finishes execution."""
+        # This slot is queued, and the thread already reports not running, so a
+        # new job may have started in between: only clean up the thread that finished
+        finished_thread = self.sender()
+        if finished_thread is not None:
+            finished_thread.deleteLater()
+        if finished_thread is not self.worker_thread:
+            logging.info("Previous worker thread finished.")
+            return
         logging.info("Worker thread finished.")
-        if self.current_worker:
-             # Ensure signals are disconnected if object persists briefly
-            try:
-                self.current_worker.progressUpdated.disconnect(self.update_progress)
-                self.current_worker.logMessage.disconnect(self.append_log_message)
-                self.current_worker.jobFinished.disconnect(self.handle_job_finished)
-                self.current_worker.diskSpaceError.disconnect(self.handle_worker_error)
-                self.current_worker.validationError.disconnect(self.handle_worker_error)
-                self.current_worker.finished.disconnect(self.worker_thread_finished)
-            except RuntimeError as e:
-                 logging.warning(f"Error disconnecting worker signals: {e}") # May happen if already disconnected
-
-            self.current_worker = None # Allow garbage collection
+        # The worker deletes itself via the thread's finished signal, which
+        # also drops all of its signal connections in one go
+        self.current_worker = None
+        self.worker_thread = None
 
         self.update_run_button_state() # Re-enable queue button if needed, disable cancel
-        # Trigger queue check shortly after to start next job if any
-        QTimer.singleShot(100, self.process_backup_queue)
+        # Start the next job, if any, once control returns to the event loop
+        QTimer.singleShot(0, self.process_backup_queue)
 
 
     # --- Edit Tab Logic ---
@@ -551,19 +862,31 @@ class MainWindow(QMainWindow):
     def load_selected_schema_for_edit(self):
         """Loads the schema selected in the ComboBox into the edit fields."""
         schema_name = self.schema_selector_combo.currentText()
-        self.clear_edit_fields() # Clear first
+        # Filling the fields must not count as an edit
+        self._loading_edit_fields = True
+        try:
+            self.clear_edit_fields() # Clear first
+
+            if schema_name and schema_name in self.schemas:
+                schema_data = self.schemas[schema_name]
+                self.schema_name_edit.setText(schema_data.get('schema_name', ''))
+                sources = schema_data.get('sources', [])
+                self._sources_model.setStringList(list(sources))
+                self._source_paths_set.update(sources)
+                self.destination_path_edit.setText(schema_data.get('destination', ''))
+        finally:
+            self._loading_edit_fields = False
 
+        self.update_edit_delete_button_state()
+        self.save_schema_button.setEnabled(False) # Disable save initially after loading
         if schema_name and schema_name in self.schemas:
-            schema_data = self.schemas[schema_name]
-            self.schema_name_edit.setText(schema_data.get('schema_name', ''))
-            self.source_paths_list.addItems(schema_data.get('sources', []))
-            self.destination_path_edit.setText(schema_data.get('destination', ''))
-            self.update_edit_delete_button_state()
-            self.save_schema_button.setEnabled(False) # Disable save initially after loading
             self.update_status_bar(f"Loaded '{schema_name}' for editing.")
-        else:
-             self.update_edit_delete_button_state()
-             self.save_schema_button.setEnabled(False)
+
+    @Slot()
+    def _mark_dirty(self):
+        """Enables the save button when an edit field is changed by the user."""
+        if not self._loading_edit_fields:
+            self.save_schema_button.setEnabled(True)
 
 
     @Slot()
@@ -578,7 +901,8 @@ class MainWindow(QMainWindow):
     def clear_edit_fields(self):
         """Helper to clear all edit fields."""
         self.schema_name_edit.clear()
-        self.source_paths_list.clear()
+        self._sources_model.setStringList([])
+        self._source_paths_set.clear()
         self.destination_path_edit.clear()
         self.update_edit_delete_button_state()
         self.save_schema_button.setEnabled(False)
@@ -590,6 +914,16 @@ class MainWindow(QMainWindow):
         self.delete_schema_button.setEnabled(is_schema_selected)
         # Save button is handled by field changes
 
+    @Slot()
+    def update_fs_filter(self):
+        """Shows directories in the path tree, plus files and hidden items when their boxes are checked."""
+        filters = QDir.Filter.AllDirs | QDir.Filter.NoDotAndDotDot
+        if self.show_files_checkbox.isChecked():
+            filters |= QDir.Filter.Files
+        if self.show_hidden_checkbox.isChecked():
+            filters |= QDir.Filter.Hidden
+        self.fs_model.setFilter(filters)
+
     @Slot()
     def add_selected_path_to_sources(self):
         """Adds the path selected in the QTreeView to the sources list."""
@@ -600,16 +934,18 @@ class MainWindow(QMainWindow):
             filepath = self.fs_model.filePath(index)
             
             # If this is the first source and schema name is empty, use folder name
-            if self.source_paths_list.count() == 0 and not self.schema_name_edit.text():
+            if self._sources_model.rowCount() == 0 and not self.schema_name_edit.text():
                 # Extract folder name from the path
                 folder_name = Path(filepath).name
                 if folder_name:
                     self.schema_name_edit.setText(folder_name)
                     
             # Check if it's already in the list
-            current_sources = [self.source_paths_list.item(i).text() for i in range(self.source_paths_list.count())]
-            if filepath not in current_sources:
-                self.source_paths_list.addItem(filepath)
+            if filepath not in self._source_paths_set:
+                row = self._sources_model.rowCount()
+                self._sources_model.insertRow(row)
+                self._sources_model.setData(self._sources_model.index(row), filepath)
+                self._source_paths_set.add(filepath)
                 self.update_status_bar(f"Added source: {filepath}")
             else:
                 self.update_status_bar(f"Source already exists: {filepath}")
@@ -617,15 +953,24 @@ class MainWindow(QMainWindow):
     @Slot()
     def remove_selected_sources(self):
         """Removes the selected item(s) from the source paths list."""
-        selected_items = self.source_paths_list.selectedItems()
-        if not selected_items:
+        selected_rows = self.source_paths_view.selectionModel().selectedRows()
+        if not selected_rows:
             self.update_status_bar("No source selected to remove.")
             return
 
-        for item in selected_items:
-            row = self.source_paths_list.row(item)
-            self.source_paths_list.takeItem(row)
-            self.update_status_bar(f"Removed source: {item.text()}")
+        sources_model = self._sources_model
+        removed_paths = []
+        # Remove from the bottom up so earlier row numbers stay valid
+        for row in sorted((index.row() for index in selected_rows), reverse=True):
+            path = sources_model.index(row).data()
+            sources_model.removeRows(row, 1)
+            self._source_paths_set.discard(path)
+            removed_paths.append(path)
+        # One status bar update for the whole selection
+        if len(removed_paths) == 1:
+            self.update_status_bar(f"Removed source: {removed_paths[0]}")
+        else:
+            self.update_status_bar(f"Removed {len(removed_paths)} sources.")
 
     @Slot()
     def set_selected_path_as_destination(self):
@@ -650,7 +995,7 @@ class MainWindow(QMainWindow):
             self.update_status_bar("Schema name cannot be empty.", error=True)
             return
 
-        sources = [self.source_paths_list.item(i).text() for i in range(self.source_paths_list.count())]
+        sources = self._sources_model.stringList()
         destination = self.destination_path_edit.text().strip()
 
         if not sources:
@@ -697,7 +1042,7 @@ class MainWindow(QMainWindow):
         if success:
             self.update_status_bar(message)
             self.save_schema_button.setEnabled(False) # Disable save after successful save
-            self.load_and_display_schemas() # Reload all schemas
+            self.refresh_single_schema(schema_name) # Only this schema's file changed
             # Re-select the saved schema in the combo box
             index = self.schema_selector_combo.findText(schema_name)
             if index >= 0:
@@ -723,7 +1068,7 @@ class MainWindow(QMainWindow):
             success, message = self.schema_manager.delete_schema(schema_name)
             self.update_status_bar(message, error=not success)
             if success:
-                self.load_and_display_schemas() # Reload schemas, which clears edit fields
+                self.remove_single_schema(schema_name) # Also clears edit fields
             # Reset button text/style if changed
             # self.delete_schema_button.setText("Delete")
         else:
@@ -739,30 +1084,27 @@ class MainWindow(QMainWindow):
     def update_status_bar(self, message, error=False):
         """Updates the text and style of the bottom status bar."""
         self.status_bar_label.setText(message)
-        if error:
-            # Apply a style to indicate error (e.g., red text)
-            # This requires the stylesheet to handle a property or use rich text
-            self.status_bar_label.setStyleSheet("QLabel#StatusBar { color: #cc3333; background-color: #353535; border-top: 1px solid #4f4f4f; font-weight: bold; padding: 3px; }")
-        else:
-            # Reset to default style
-             self.status_bar_label.setStyleSheet("QLabel#StatusBar { color: #ffffff; background-color: #353535; border-top: 1px solid #4f4f4f; font-weight: bold; padding: 3px; }")
-        logging.info(f"Status Bar: {message}")
+        # Only restyle when switching between normal and error (red text) state
+        if error != self._status_is_error:
+            self.status_bar_label.setStyleSheet(self._STATUS_STYLE_ERR if error else self._STATUS_STYLE_OK)
+            self._status_is_error = error
+        if logging.getLogger().isEnabledFor(logging.INFO):
+            logging.info(f"Status Bar: {message}")
 
 
     # --- Application Exit ---
     def closeEvent(self, event):
         """Handles the main window closing event."""
         logging.info("Close event triggered.")
-        if self.current_worker and self.current_worker.isRunning():
+        if self._is_backup_running():
             # Prompt user? Or just try to cancel? Let's try to cancel.
             logging.warning("Backup in progress. Attempting to cancel...")
             self.update_status_bar("Backup in progress. Attempting to cancel before exit...")
             self.current_worker.cancel()
-            # Give it a moment to try and terminate
-            # In a real app, might wait briefly or ask user to confirm exit
-            # self.current_worker.wait(500) # Wait max 500ms - might block GUI
-            # For simplicity, we'll just let it try to terminate and exit
+            # The worker notices the cancel within one poll interval, so a short
+            # wait lets the thread end before it is destroyed with the window
             # Note: rsync might continue if termination fails quickly
+            self.worker_thread.wait(1000)
 
         logging.info("Exiting BackItUp.")
         event.accept()
@@ -1,46 +1,114 @@
 import yaml
 import os
+import copy
+import threading
 from pathlib import Path
 import logging
 
-from .constants import CONFIG_DIR
+from .constants import get_config_dir
 from .utils import sanitize_filename, validate_schema_paths
 
+# Prefer the LibYAML-backed C loader/dumper; fall back to the pure-Python ones
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+class _SchemaDumper(_SafeDumper):
+    """Safe dumper that always writes lists in block style."""
+
+def _represent_block_list(dumper, data):
+    return dumper.represent_sequence('tag:yaml.org,2002:seq', data, flow_style=False)
+
+# Registered on a subclass so PyYAML's shared SafeDumper classes stay untouched
+_SchemaDumper.add_representer(list, _represent_block_list)
+
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class SchemaManager:
-    def __init__(self, config_dir=CONFIG_DIR):
-        self.config_dir = Path(config_dir)
+    def __init__(self, config_dir=None):
+        self.config_dir = Path(config_dir) if config_dir is not None else get_config_dir()
         self.config_dir.mkdir(parents=True, exist_ok=True)
+        # Parsed YAML per schema file, keyed by path: ((st_mtime_ns, st_size), data).
+        # Schemas may be loaded from a background thread, hence the lock.
+        self._schema_cache = {}
+        self._cache_lock = threading.Lock()
 
     def get_schema_filepath(self, schema_name):
         """Generates the expected filepath for a given schema name."""
         sanitized_name = sanitize_filename(schema_name)
         return self.config_dir / f"{sanitized_name}.yaml"
 
-    def load_schemas(self):
-        """Loads all valid schemas from the configuration directory."""
+    def _read_schema_file(self, filepath, stat_result=None):
+        """
+        Returns the parsed YAML of a schema file, reusing the cached parse while
+        the file's mtime and size are unchanged. Callers get their own copy.
+        """
+        if stat_result is None:
+            stat_result = filepath.stat()
+        key = (stat_result.st_mtime_ns, stat_result.st_size)
+        with self._cache_lock:
+            cached = self._schema_cache.get(filepath)
+        if cached is not None and cached[0] == key:
+            return copy.deepcopy(cached[1])
+
+        with open(filepath, 'r') as f:
+            schema_data = yaml.load(f, Loader=_SafeLoader)
+        with self._cache_lock:
+            self._schema_cache[filepath] = (key, schema_data)
+        return copy.deepcopy(schema_data)
+
+    def _evict_cached_schema(self, filepath):
+        """Drops a schema file from the parse cache."""
+        with self._cache_lock:
+            self._schema_cache.pop(filepath, None)
+
+    def load_schemas(self, validate=True):
+        """
+        Loads all valid schemas from the configuration directory.
+
+        Args:
+            validate (bool): Also check that each schema's paths exist and store the
+                result in '_is_valid'/'_invalid_paths'. Pass False to skip the
+                filesystem checks (e.g. when they are done separately in the background).
+        """
         schemas = {}
-        for filepath in self.config_dir.glob("*.yaml"):
-            try:
-                with open(filepath, 'r') as f:
-                    schema_data = yaml.safe_load(f)
-                # Basic validation: check for required keys
-                if schema_data and 'schema_name' in schema_data and 'sources' in schema_data and 'destination' in schema_data:
-                    # Use the name from the file content, not the filename itself
-                    schema_name = schema_data['schema_name']
-                    # Perform path validation
-                    is_valid, invalid_paths = validate_schema_paths(schema_data)
-                    schema_data['_is_valid'] = is_valid # Store validation status
-                    schema_data['_invalid_paths'] = invalid_paths
-                    schema_data['_filepath'] = str(filepath) # Store filepath for reference
-                    schemas[schema_name] = schema_data
-                else:
-                    logging.warning(f"Skipping invalid schema file (missing keys): {filepath.name}")
-            except yaml.YAMLError as e:
-                logging.error(f"Error loading schema file {filepath.name}: {e}")
-            except Exception as e:
-                logging.error(f"Unexpected error loading schema {filepath.name}: {e}")
+        seen_filepaths = set()
+        with os.scandir(self.config_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith(".yaml"):
+                    continue
+                try:
+                    # is_file() answers from the directory entry type where it can,
+                    # and entry.stat() is cached on the entry for the parse cache key
+                    if not entry.is_file():
+                        continue
+                    stat_result = entry.stat()
+                    filepath = Path(entry.path)
+                    seen_filepaths.add(filepath)
+                    schema_data = self._read_schema_file(filepath, stat_result)
+                    # Basic validation: check for required keys
+                    if schema_data and 'schema_name' in schema_data and 'sources' in schema_data and 'destination' in schema_data:
+                        # Use the name from the file content, not the filename itself
+                        schema_name = schema_data['schema_name']
+                        if validate:
+                            # Perform path validation
+                            is_valid, invalid_paths = validate_schema_paths(schema_data)
+                            schema_data['_is_valid'] = is_valid # Store validation status
+                            schema_data['_invalid_paths'] = invalid_paths
+                        schema_data['_filepath'] = str(filepath) # Store filepath for reference
+                        schemas[schema_name] = schema_data
+                    else:
+                        logging.warning(f"Skipping invalid schema file (missing keys): {entry.name}")
+                except yaml.YAMLError as e:
+                    logging.error(f"Error loading schema file {entry.name}: {e}")
+                except Exception as e:
+                    logging.error(f"Unexpected error loading schema {entry.name}: {e}")
+
+        # Forget files that have disappeared since the last load
+        with self._cache_lock:
+            for filepath in self._schema_cache.keys() - seen_filepaths:
+                del self._schema_cache[filepath]
         return schemas
 
     def load_single_schema(self, schema_name):
@@ -48,8 +116,7 @@ class SchemaManager:
         filepath = self.get_schema_filepath(schema_name)
         if filepath.exists():
             try:
-                with open(filepath, 'r') as f:
-                    schema_data = yaml.safe_load(f)
+                schema_data = self._read_schema_file(filepath)
                 if schema_data and schema_data.get('schema_name') == schema_name:
                      # Perform path validation
                     is_valid, invalid_paths = validate_schema_paths(schema_data)
@@ -86,18 +153,44 @@ class SchemaManager:
         # Clean up internal keys before saving
         data_to_save = {k: v for k, v in schema_data.items() if not k.startswith('_')}
 
+        # Skip the write if the file already holds exactly this data, so an
+        # unedited save doesn't touch the file or invalidate its cached parse
         try:
-            with open(filepath, 'w') as f:
-                yaml.dump(data_to_save, f, default_flow_style=False, sort_keys=False)
+            if self._read_schema_file(filepath) == data_to_save:
+                logging.info(f"Schema '{schema_name}' unchanged, not rewriting {filepath.name}")
+                return True, f"Schema '{schema_name}' is unchanged."
+        except (OSError, yaml.YAMLError):
+            pass # Missing or unreadable: just write it
+
+        self._evict_cached_schema(filepath)
+        # Write to a temporary file and swap it in, so a crash or full disk
+        # never leaves a truncated schema file behind
+        tmp_filepath = filepath.with_suffix('.yaml.tmp')
+        try:
+            with open(tmp_filepath, 'w') as f:
+                yaml.dump(data_to_save, f, Dumper=_SchemaDumper, sort_keys=False)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_filepath, filepath)
+            # Seed the parse cache with what was just written, so reading the
+            # schema back (e.g. to refresh the UI) doesn't parse the file again
+            stat_result = filepath.stat()
+            with self._cache_lock:
+                self._schema_cache[filepath] = ((stat_result.st_mtime_ns, stat_result.st_size), copy.deepcopy(data_to_save))
             logging.info(f"Schema '{schema_name}' saved to {filepath.name}")
             return True, f"Schema '{schema_name}' saved successfully."
         except Exception as e:
             logging.error(f"Error saving schema '{schema_name}' to {filepath.name}: {e}")
+            try:
+                os.remove(tmp_filepath)
+            except OSError:
+                pass
             return False, f"Error saving schema '{schema_name}'."
 
     def delete_schema(self, schema_name):
         """Deletes the .yaml file corresponding to the schema name."""
         filepath = self.get_schema_filepath(schema_name)
+        self._evict_cached_schema(filepath)
         if filepath.exists():
             try:
                 os.remove(filepath)
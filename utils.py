@@ -1,28 +1,64 @@
 import re
 import os
-from pathlib import Path
+import time
+import threading
+
+# Replaces spaces with underscores and deletes characters that are problematic
+# in filenames (adjust the set of characters based on strictness needed)
+_SANITIZE_TABLE = str.maketrans({" ": "_", **{c: None for c in '\\/*?:"<>|'}})
+# Trailing dots or spaces (problematic on some systems)
+_TRAILING_DOTSPACE_RE = re.compile(r'[. ]+$')
 
 def sanitize_filename(name):
     """Removes or replaces characters invalid for filenames."""
     # Remove leading/trailing whitespace
     name = name.strip()
-    # Replace spaces with underscores
-    name = name.replace(" ", "_")
-    # Remove characters that are problematic in filenames
-    # (adjust the set of characters based on strictness needed)
-    invalid_chars = r'[\\/*?:"<>|]'
-    name = re.sub(invalid_chars, '', name)
+    # Replace spaces with underscores and remove problematic characters in one pass
+    name = name.translate(_SANITIZE_TABLE)
     # Prevent empty names or names consisting only of invalid chars
     if not name:
         name = "untitled_schema"
     # Ensure it doesn't end with a dot or space (problematic on some systems)
-    name = re.sub(r'[. ]+$', '', name)
+    name = _TRAILING_DOTSPACE_RE.sub('', name)
     # Handle reserved names if necessary (e.g., CON, PRN on Windows, though less relevant on Linux)
     # For simplicity, we'll skip this for now on Linux target.
     if not name: # Check again after potential removal of trailing dots/spaces
         name = "untitled_schema_final"
     return name
 
+# Recent path existence checks: {path: (checked_at, exists)}. Schemas are
+# validated on load and again right before each run, often for the same paths.
+# The thread pool tasks share it, so access goes through _STAT_CACHE_LOCK.
+_STAT_CACHE = {}
+_STAT_CACHE_LOCK = threading.Lock()
+_STAT_TTL = 1.0 # Seconds a cached result is trusted
+_STAT_CACHE_MAX = 1024 # Past this size expired entries are pruned, and if that's not enough, all of them
+
+def _path_exists(path):
+    """
+    Like Path(path).exists(), but reuses a check made within the last _STAT_TTL seconds.
+    Unlike Path('').exists() (the current directory), an empty path does not exist.
+    """
+    now = time.monotonic()
+    with _STAT_CACHE_LOCK:
+        cached = _STAT_CACHE.get(path)
+    if cached is not None and now - cached[0] < _STAT_TTL:
+        return cached[1]
+    try:
+        os.stat(path) # Follows symlinks, as Path.exists() does
+        exists = True
+    except (OSError, ValueError):
+        exists = False
+    with _STAT_CACHE_LOCK:
+        _STAT_CACHE[path] = (now, exists)
+        if len(_STAT_CACHE) > _STAT_CACHE_MAX:
+            # Keep only results that are still fresh; the rest would be re-checked anyway
+            for stale_path in [p for p, (checked_at, _) in _STAT_CACHE.items() if now - checked_at >= _STAT_TTL]:
+                del _STAT_CACHE[stale_path]
+            if len(_STAT_CACHE) > _STAT_CACHE_MAX:
+                _STAT_CACHE.clear() # Still too big: a hard cap beats an unbounded dict
+    return exists
+
 def validate_schema_paths(schema_data):
     """
     Checks if all source paths and the destination path in a schema exist.
@@ -47,11 +83,9 @@ def validate_schema_paths(schema_data):
 
     if not destination or not isinstance(destination, str):
         invalid_paths.append("Destination path is missing or invalid")
-    elif not Path(destination).exists():
+    elif not _path_exists(destination):
         invalid_paths.append(f"Destination: {destination}")
 
-    for src in sources:
-        if not isinstance(src, str) or not Path(src).exists():
-            invalid_paths.append(f"Source: {src}")
+    invalid_paths += [f"Source: {src}" for src in sources if not isinstance(src, str) or not _path_exists(src)]
 
     return not invalid_paths, invalid_paths
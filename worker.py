@@ -2,20 +2,34 @@ import subprocess
 import shlex
 import re
 import os
-import shutil
+import select
 import logging
+import time
 from pathlib import Path
 
-from PySide6.QtCore import QThread, Signal, QObject
+from PySide6.QtCore import QRunnable, Signal, Slot, QObject
 
 from .utils import validate_schema_paths
 
 # Configure logging for the worker
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - Worker - %(message)s')
+logger = logging.getLogger(__name__)
 
-class BackupWorker(QThread):
+# rsync ends --info=progress2 updates with \r and regular lines with \n
+_LINE_SPLIT_RE = re.compile(rb'[\r\n]')
+# Percentage field of a progress line; matched on the raw bytes before decoding
+_PROGRESS_RE = re.compile(rb'\s(\d{1,3})%\s')
+_READ_CHUNK_SIZE = 64 * 1024
+_POLL_TIMEOUT_MS = 100 # Upper bound on how long a cancel request goes unnoticed
+_EMIT_INTERVAL_NS = 50_000_000 # Min. time between progress/log signals to the GUI (50 ms)
+
+class BackupWorker(QObject):
     """
-    Worker thread to execute a single rsync backup job.
+    Worker object that executes a single rsync backup job.
+
+    It is moved to its own QThread by the caller; connect the thread's
+    started signal to start() and this object's finished signal to the
+    thread's quit().
     """
     # Signals
     progressUpdated = Signal(str, int) # schema_name, percentage
@@ -23,6 +37,7 @@ class BackupWorker(QThread):
     jobFinished = Signal(str, bool, str) # schema_name, success (bool), status_message
     diskSpaceError = Signal(str, str)  # schema_name, error_message
     validationError = Signal(str, str) # schema_name, error_message
+    finished = Signal()                # Emitted last, whatever the outcome
 
     def __init__(self, schema_data, parent=None):
         super().__init__(parent)
@@ -32,10 +47,24 @@ class BackupWorker(QThread):
         self.schema_name = schema_data['schema_name']
         self._is_cancelled = False
         self._process = None
+        # Coalescing state for signals sent to the GUI thread
+        self._last_progress = -1
+        self._last_emit_ns = 0
+        self._pending_progress = None # Latest percentage not sent yet
+        self._log_lines = []
+        self._last_log_emit_ns = 0
+
+    @Slot()
+    def start(self):
+        """Runs the backup on the thread this worker lives in, then signals finished."""
+        try:
+            self.run()
+        finally:
+            self.finished.emit()
 
     def run(self):
         """Executes the backup process."""
-        logging.info(f"Worker started for schema: {self.schema_name}")
+        logger.info(f"Worker started for schema: {self.schema_name}")
         self.logMessage.emit(self.schema_name, f"Starting backup for '{self.schema_name}'...")
 
         # --- Pre-flight Checks ---
@@ -43,7 +72,7 @@ class BackupWorker(QThread):
         is_valid, invalid_paths = validate_schema_paths(self.schema_data)
         if not is_valid:
             error_msg = f"Path validation failed before starting: {', '.join(invalid_paths)}"
-            logging.error(f"[{self.schema_name}] {error_msg}")
+            logger.error(f"[{self.schema_name}] {error_msg}")
             self.validationError.emit(self.schema_name, error_msg)
             self.jobFinished.emit(self.schema_name, False, "Path validation failed")
             return
@@ -56,25 +85,27 @@ class BackupWorker(QThread):
             # For now, just check if destination has *some* reasonable free space.
             # Let's require at least 100MB free as a basic check.
             free_space_threshold = 100 * 1024 * 1024 # 100 MB
-            usage = shutil.disk_usage(destination)
-            if usage.free < free_space_threshold:
+            # One statvfs call; validate_schema_paths' cached check covered existence
+            fs_stats = os.statvfs(destination)
+            free_space = fs_stats.f_bavail * fs_stats.f_frsize # Space available to unprivileged users
+            if free_space < free_space_threshold:
                  # A more sophisticated check could try to estimate source size
                  # total_source_size = sum(p.stat().st_size for s in self.schema_data['sources'] for p in Path(s).rglob('*') if p.is_file())
-                 # if usage.free < total_source_size: # This is still not perfect due to rsync behavior
-                error_msg = f"Insufficient disk space at destination '{destination}'. Free: {usage.free / (1024*1024):.2f} MB"
-                logging.error(f"[{self.schema_name}] {error_msg}")
+                 # if free_space < total_source_size: # This is still not perfect due to rsync behavior
+                error_msg = f"Insufficient disk space at destination '{destination}'. Free: {free_space / (1024*1024):.2f} MB"
+                logger.error(f"[{self.schema_name}] {error_msg}")
                 self.diskSpaceError.emit(self.schema_name, error_msg)
                 self.jobFinished.emit(self.schema_name, False, "Insufficient disk space")
                 return
         except FileNotFoundError:
             error_msg = f"Destination directory '{destination}' not found for disk space check."
-            logging.error(f"[{self.schema_name}] {error_msg}")
+            logger.error(f"[{self.schema_name}] {error_msg}")
             self.validationError.emit(self.schema_name, error_msg) # Treat as validation error
             self.jobFinished.emit(self.schema_name, False, "Destination not found")
             return
         except Exception as e:
             error_msg = f"Error checking disk space for '{destination}': {e}"
-            logging.error(f"[{self.schema_name}] {error_msg}")
+            logger.error(f"[{self.schema_name}] {error_msg}")
             # Decide if this is fatal or just a warning? Let's make it fatal.
             self.diskSpaceError.emit(self.schema_name, error_msg)
             self.jobFinished.emit(self.schema_name, False, "Disk space check error")
@@ -86,68 +117,99 @@ class BackupWorker(QThread):
         dest_path = str(destination)
 
         # Use -a (archive), --info=progress2 (parsable progress), --delete (optional, consider adding later)
+        # stats0,name0 silence the end-of-run summary and per-file names, leaving only progress lines
         # Add --no-i-r to potentially speed up progress reporting on large numbers of files
-        rsync_command = ["rsync", "-a", "--info=progress2", "--no-i-r"] + source_paths + [dest_path]
-        command_str = " ".join(rsync_command)
-        logging.info(f"Executing command: {command_str}")
-        self.logMessage.emit(self.schema_name, f"Running: {command_str}")
+        # --outbuf=L makes rsync flush per line, so reads get whole progress updates
+        rsync_command = ["rsync", "-a", "--info=progress2,stats0,name0", "--no-i-r", "--outbuf=L"] + source_paths + [dest_path]
+        if logger.isEnabledFor(logging.INFO):
+            # Only build the (shell-quoted) command line when it will be shown
+            command_str = shlex.join(rsync_command)
+            logger.info(f"Executing command: {command_str}")
+            self.logMessage.emit(self.schema_name, f"Running: {command_str}")
 
         # --- Execute rsync ---
         try:
-            self._process = subprocess.Popen(
+            process = subprocess.Popen(
                 rsync_command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
-                text=True,
-                encoding='utf-8',
-                errors='replace', # Handle potential encoding errors
-                bufsize=1 # Line buffered
+                bufsize=0 # Binary and unbuffered: output is read straight from the fds and only decoded when logged
             )
+            # run() keeps its own reference; self._process is only for cancel()
+            self._process = process
 
-            # Monitor stdout for progress
-            while True:
+            # Monitor stdout for progress and collect stderr as it arrives. Both
+            # pipes are read without blocking, in chunks, so a cancel request is
+            # noticed within one poll timeout instead of waiting for rsync's next
+            # line, and rsync can never stall on a full stderr pipe.
+            stdout_fd = process.stdout.fileno()
+            stderr_fd = process.stderr.fileno()
+            poller = select.poll()
+            for fd in (stdout_fd, stderr_fd):
+                os.set_blocking(fd, False)
+                poller.register(fd, select.POLLIN)
+            open_fds = {stdout_fd, stderr_fd}
+            pending = b""
+            stderr_data = bytearray()
+            stderr_pending = b""
+            while open_fds:
                 if self._is_cancelled:
-                    logging.info(f"Cancellation requested for schema: {self.schema_name}")
+                    logger.info(f"Cancellation requested for schema: {self.schema_name}")
                     self.terminate_process()
-                    self.jobFinished.emit(self.schema_name, False, "Cancelled")
-                    return
-
-                line = self._process.stdout.readline()
-                if not line and self._process.poll() is not None:
-                    break # Process finished
-
-                if line:
-                    self.logMessage.emit(self.schema_name, line.strip())
-                    # Example rsync --info=progress2 output line:
-                    # 1,234,567 10%  10.00MB/s 0:00:10 (xfr#1, to-chk=10/20)
-                    # Sometimes it might just be a filename
-                    match = re.search(r'\s+(\d+)%\s+', line)
-                    if match:
-                        progress = int(match.group(1))
-                        self.progressUpdated.emit(self.schema_name, progress)
-
-            # Capture any remaining stderr
-            stderr_output = self._process.stderr.read()
-            if stderr_output:
-                logging.warning(f"[{self.schema_name}] rsync stderr: {stderr_output.strip()}")
-                self.logMessage.emit(self.schema_name, f"STDERR: {stderr_output.strip()}")
+                    break # Reaped and reported as cancelled below
+
+                events = poller.poll(_POLL_TIMEOUT_MS)
+                if not events:
+                    # rsync is quiet (large file, stalled network): don't keep
+                    # the last lines and percentage waiting for more output
+                    self._flush_held_output()
+                for fd, _event in events:
+                    try:
+                        chunk = os.read(fd, _READ_CHUNK_SIZE)
+                    except BlockingIOError:
+                        continue
+                    if not chunk:
+                        # EOF: process closed this pipe
+                        poller.unregister(fd)
+                        open_fds.discard(fd)
+                    elif fd == stdout_fd:
+                        # Keep a trailing partial line for the next chunk
+                        *lines, pending = _LINE_SPLIT_RE.split(pending + chunk)
+                        self._handle_output_lines(lines)
+                    else:
+                        stderr_data += chunk
+                        *lines, stderr_pending = (stderr_pending + chunk).split(b"\n")
+                        self._handle_error_lines(lines)
 
-            return_code = self._process.wait() # Wait for process to ensure it's finished
+            if pending:
+                self._handle_output_lines([pending])
+            if stderr_pending:
+                self._handle_error_lines([stderr_pending])
+            self._flush_held_output() # Anything still held back by the coalescing
 
-            if self._is_cancelled: # Check again after process finished naturally
-                 self.jobFinished.emit(self.schema_name, False, "Cancelled")
-                 return
+            return_code = process.wait() # Wait for process to ensure it's finished
+
+            # A cancel that killed rsync also ends the loop (both pipes hit EOF),
+            # so report it before the return code is interpreted as a failure
+            if self._is_cancelled:
+                logger.info(f"Backup cancelled for schema: {self.schema_name}")
+                self.jobFinished.emit(self.schema_name, False, "Cancelled")
+                return
+
+            stderr_output = stderr_data.decode('utf-8', errors='replace') # Handle potential encoding errors
+            if stderr_output:
+                logger.warning(f"[{self.schema_name}] rsync stderr: {stderr_output.strip()}")
 
             # Return code 24 is a special case for rsync - it means "some files vanished"
             # This is common when backing up actively used directories like browser data
             if return_code == 0:
-                logging.info(f"Schema '{self.schema_name}' backup completed successfully.")
+                logger.info(f"Schema '{self.schema_name}' backup completed successfully.")
                 self.progressUpdated.emit(self.schema_name, 100) # Ensure 100% on success
                 self.jobFinished.emit(self.schema_name, True, "Completed")
             elif return_code == 24:
                 # Treat code 24 as a partial success with warning
                 warning_msg = "Completed with warnings: Some files changed during transfer."
-                logging.warning(f"[{self.schema_name}] {warning_msg} Return code: {return_code}")
+                logger.warning(f"[{self.schema_name}] {warning_msg} Return code: {return_code}")
                 if stderr_output:
                     self.logMessage.emit(self.schema_name, f"Warning: {stderr_output.strip()}")
                     warning_msg += f" Details: {stderr_output.strip()}"
@@ -156,7 +218,7 @@ class BackupWorker(QThread):
                 self.jobFinished.emit(self.schema_name, True, warning_msg)
             else:
                 error_msg = f"rsync failed with return code {return_code}."
-                logging.error(f"[{self.schema_name}] {error_msg}")
+                logger.error(f"[{self.schema_name}] {error_msg}")
                 # Add stderr to the message if available
                 if stderr_output:
                     error_msg += f" Stderr: {stderr_output.strip()}"
@@ -164,36 +226,145 @@ class BackupWorker(QThread):
 
         except FileNotFoundError:
             error_msg = "rsync command not found. Please ensure rsync is installed and in your PATH."
-            logging.error(f"[{self.schema_name}] {error_msg}")
+            logger.error(f"[{self.schema_name}] {error_msg}")
             self.jobFinished.emit(self.schema_name, False, error_msg)
         except Exception as e:
             error_msg = f"An unexpected error occurred during backup: {e}"
-            logging.exception(f"[{self.schema_name}] Unexpected error") # Log full traceback
+            logger.exception(f"[{self.schema_name}] Unexpected error") # Log full traceback
             self.jobFinished.emit(self.schema_name, False, error_msg)
         finally:
             self._process = None # Clear process reference
 
+    def _handle_output_lines(self, lines):
+        """Logs a batch of raw rsync stdout lines and reports only the latest progress value."""
+        for raw_line in lines:
+            raw_line = raw_line.strip()
+            if not raw_line:
+                continue
+            self._log_lines.append(raw_line.decode('utf-8', errors='replace'))
+            # Example rsync --info=progress2 output line:
+            # 1,234,567 10%  10.00MB/s 0:00:10 (xfr#1, to-chk=10/20)
+            # Sometimes it might just be a filename
+            match = _PROGRESS_RE.search(raw_line)
+            if match:
+                self._pending_progress = int(match.group(1))
+        now = time.monotonic_ns()
+        self._send_progress(now)
+        self._flush_log_lines_if_due(now)
+
+    def _send_progress(self, now, force=False):
+        """Sends the latest percentage if it is new, at most once per interval unless forced."""
+        progress = self._pending_progress
+        if progress is None:
+            return
+        if progress == self._last_progress:
+            self._pending_progress = None
+            return
+        if force or now - self._last_emit_ns >= _EMIT_INTERVAL_NS:
+            self.progressUpdated.emit(self.schema_name, progress)
+            self._last_progress = progress
+            self._last_emit_ns = now
+            self._pending_progress = None
+
+    def _flush_held_output(self):
+        """Sends the log lines and percentage the coalescing is still holding back."""
+        now = time.monotonic_ns()
+        self._send_progress(now, force=True)
+        self._flush_log_lines()
+        self._last_log_emit_ns = now
+
+    def _handle_error_lines(self, lines):
+        """Adds raw rsync stderr lines to the log, in order with the stdout lines."""
+        for raw_line in lines:
+            raw_line = raw_line.strip()
+            if raw_line:
+                self._log_lines.append(f"STDERR: {raw_line.decode('utf-8', errors='replace')}")
+        self._flush_log_lines_if_due(time.monotonic_ns())
+
+    def _flush_log_lines_if_due(self, now):
+        """Sends the collected output lines, at most once per interval."""
+        if now - self._last_log_emit_ns >= _EMIT_INTERVAL_NS:
+            self._flush_log_lines()
+            self._last_log_emit_ns = now
+
+    def _flush_log_lines(self):
+        """Sends the collected output lines to the log as one message."""
+        if self._log_lines:
+            self.logMessage.emit(self.schema_name, "\n".join(self._log_lines))
+            self._log_lines.clear()
+
     def cancel(self):
-        """Signals the worker to cancel the backup."""
-        logging.info(f"Cancel method called for schema: {self.schema_name}")
+        """
+        Signals the worker to cancel the backup. Call it directly from the GUI
+        thread: the worker's own thread is busy in run() and won't process
+        queued slot calls until the job is over.
+        """
+        logger.info(f"Cancel method called for schema: {self.schema_name}")
         self._is_cancelled = True
         self.terminate_process() # Attempt immediate termination
 
     def terminate_process(self):
         """Terminates the running rsync process if it exists."""
-        if self._process and self._process.poll() is None: # Check if process exists and is running
+        process = self._process # May be called from the GUI thread while run() finishes
+        if process and process.poll() is None: # Check if process exists and is running
             try:
-                logging.warning(f"Terminating rsync process (PID: {self._process.pid}) for schema: {self.schema_name}")
-                self._process.terminate() # Send SIGTERM
+                logger.warning(f"Terminating rsync process (PID: {process.pid}) for schema: {self.schema_name}")
+                process.terminate() # Send SIGTERM
                 # Optionally, wait a short time and send SIGKILL if it doesn't terminate
-                # self._process.wait(timeout=1)
+                # process.wait(timeout=1)
             except ProcessLookupError:
-                 logging.info(f"Process for {self.schema_name} already finished.")
+                 logger.info(f"Process for {self.schema_name} already finished.")
             except Exception as e:
-                logging.error(f"Error terminating process for schema {self.schema_name}: {e}")
-            finally:
-                self._process = None # Ensure reference is cleared
+                logger.error(f"Error terminating process for schema {self.schema_name}: {e}")
+            # The reference is cleared by run() once it has reaped the process
 
-    def __del__(self):
-        # Ensure thread quits properly if deleted
-        self.wait()
+
+class SchemaLoadSignals(QObject):
+    """
+    Signals for SchemaLoadTask. QRunnable can't emit signals itself, so the
+    receiver owns one of these on its own (GUI) thread and hands it to each task.
+    """
+    schemasLoaded = Signal(int, object) # load_id, {schema_name: schema_data}
+    schemaValidated = Signal(int, str, bool, object) # load_id, schema_name, is_valid, invalid_paths
+
+
+class SchemaLoadTask(QRunnable):
+    """
+    Thread pool job that loads all schemas off the GUI thread.
+    """
+    def __init__(self, schema_manager, signals, load_id):
+        super().__init__()
+        self.schema_manager = schema_manager
+        self.signals = signals
+        self.load_id = load_id # Lets the receiver ignore results from superseded loads
+
+    def run(self):
+        try:
+            # Path checks run separately in SchemaValidationTask
+            schemas = self.schema_manager.load_schemas(validate=False)
+        except Exception:
+            logger.exception("Unexpected error loading schemas in the background")
+            schemas = {}
+        self.signals.schemasLoaded.emit(self.load_id, schemas)
+
+
+class SchemaValidationTask(QRunnable):
+    """
+    Thread pool job that checks the source/destination paths of each schema
+    and reports the result per schema as it goes.
+    """
+    def __init__(self, schemas, signals, load_id):
+        super().__init__()
+        # Shallow copies, so the GUI thread can keep mutating its own dicts
+        self.schemas = [(name, dict(data)) for name, data in schemas.items()]
+        self.signals = signals
+        self.load_id = load_id
+
+    def run(self):
+        for schema_name, schema_data in self.schemas:
+            try:
+                is_valid, invalid_paths = validate_schema_paths(schema_data)
+            except Exception as e:
+                logger.error(f"Error validating paths for schema '{schema_name}': {e}")
+                is_valid, invalid_paths = False, [str(e)]
+            self.signals.schemaValidated.emit(self.load_id, schema_name, is_valid, invalid_paths)